@@ -1,15 +1,101 @@
+from __future__ import annotations
+
 import asyncio
+import contextvars
 import time
 import aiohttp
+import orjson
 import logging
 import hashlib
+import random
+from dataclasses import dataclass, field
+import ssl
+import sys
+from yarl import URL
+from aiolimiter import AsyncLimiter
 
 logger = logging.getLogger(__name__)
 
-from voluptuous import Optional
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:
+    HAS_BROTLI = False
 
 BASEURL = "https://openapi.alphaess.com/api"
 
+_BATCH_TS = contextvars.ContextVar("batch_ts", default=None)
+
+CACHE_TTLS = {
+    "getChargeConfigInfo": 60,
+    "getDisChargeConfigInfo": 60,
+    "getSumDataForCustomer": 30,
+    "getLastPowerData": 0,
+    "getOneDateEnergyBySn": 15
+}
+
+RETRY_ATTEMPTS = 5
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_ENDPOINTS = {
+    "getESSList": ("getEssList", "GET"),
+    "getLastPowerData": ("getLastPowerData", "GET"),
+    "getOneDayPowerBySn": ("getOneDayPowerBySn", "GET"),
+    "getSumDataForCustomer": ("getSumDataForCustomer", "GET"),
+    "getOneDateEnergyBySn": ("getOneDateEnergyBySn", "GET"),
+    "getChargeConfigInfo": ("getChargeConfigInfo", "GET"),
+    "getDisChargeConfigInfo": ("getDisChargeConfigInfo", "GET"),
+    "updateChargeConfigInfo": ("updateChargeConfigInfo", "POST"),
+    "updateDisChargeConfigInfo": ("updateDisChargeConfigInfo", "POST"),
+}
+
+
+def install_uvloop() -> bool:
+    """Install the uvloop event loop policy; call before asyncio.run(). Returns False where uvloop is unavailable."""
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop is not installed, keeping the default event loop policy")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _to_numpy(data):
+    """Convert a list of uniform dicts into a structured numpy array
+
+    Fields holding only numbers or None become f8 (None as nan); all other fields are kept as objects.
+    """
+    if not isinstance(data, list) or not data or not all(isinstance(row, dict) for row in data):
+        return data
+    names = tuple(data[0])
+    if any(tuple(row) != names for row in data):
+        return data
+
+    import numpy as np
+    dtype = [
+        (k, "f8" if all(row[k] is None or type(row[k]) in (int, float) for row in data) else "O")
+        for k in names
+    ]
+    return np.array([tuple(row[k] for k in names) for row in data], dtype=dtype)
+
+
+
+@dataclass
+class ESSBatch:
+    """Per-field lists of getdata results, one entry per system in sys_sns order.
+
+    one_day_power holds None for every system unless getdata_soa was called with get_power=True.
+    """
+    sys_sns: list = field(default_factory=list)
+    sum_data: list = field(default_factory=list)
+    one_date_energy: list = field(default_factory=list)
+    last_power: list = field(default_factory=list)
+    charge_cfg: list = field(default_factory=list)
+    discharge_cfg: list = field(default_factory=list)
+    one_day_power: list = field(default_factory=list)
+
 
 class alphaess:
     """Class for Alpha ESS."""
@@ -19,228 +105,286 @@ class alphaess:
             appID,
             appSecret,
             session: aiohttp.ClientSession | None = None,
-            timeout: int = 30
+            timeout: int = 30,
+            max_concurrency: int = 8,
+            rate_per_sec: float = 10,
+            cache_ttls: dict | None = None,
+            transport: str = "aiohttp"
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        cache_ttls maps endpoint method names (e.g. "getESSList") to the number of seconds a GET response is
+        reused for; pass {} to disable caching. Unknown names raise ValueError.
+
+        transport="httpx" sends requests over a single multiplexed HTTP/2 httpx.AsyncClient instead of aiohttp;
+        it cannot be combined with session.
+        """
         self.appID = appID
         self.appSecret = appSecret
         self.accesstoken = None
         self.expiresin = None
         self.tokencreatetime = None
         self.refreshtoken = None
-        self.session = session or aiohttp.ClientSession()
-        self._created_session = not session
+        self._sig_base = hashlib.sha512((str(appID) + str(appSecret)).encode('ascii'))
+        self._hdr_cache = (None, None)
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "Accept": "*/*",
+            "Cache-Control": "no-cache",
+            "appId": str(appID)
+        }
+        if transport not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unknown transport {transport!r}, expected 'aiohttp' or 'httpx'")
+        if transport == "httpx" and session is not None:
+            raise ValueError("An aiohttp session cannot be used with transport='httpx'")
+
         self.timeout = timeout
+        self._httpx = None
+        if transport == "httpx":
+            import httpx
+            self._httpx = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+                timeout=self.timeout
+            )
+            self.session = None
+            self._created_session = False
+        else:
+            self.session = session or self.__create_session()
+            self._created_session = not session
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._limiter = AsyncLimiter(max_rate=rate_per_sec, time_period=1)
+        self._cache = {}
+        if cache_ttls is None:
+            cache_ttls = CACHE_TTLS
+        unknown = set(cache_ttls) - set(_ENDPOINTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown cache_ttls endpoints {sorted(unknown)}, expected method names from {list(_ENDPOINTS)}"
+            )
+        self._cache_ttls = {_ENDPOINTS[name][0]: ttl for name, ttl in cache_ttls.items()}
+        self._urls = {path: URL(f"{BASEURL}/{path}") for path, _ in _ENDPOINTS.values()}
 
     async def close(self) -> None:
         """Close the AlphaESS API client."""
         if self._created_session:
             await self.session.close()
+        if self._httpx is not None:
+            await self._httpx.aclose()
+
+    def __create_session(self) -> aiohttp.ClientSession:
+        """Create a pooled keep-alive session for the AlphaESS API host."""
+        if not HAS_BROTLI:
+            logger.debug("brotli/brotlicffi is not installed, responses will not be brotli compressed")
+
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ssl=ssl.create_default_context()
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"Connection": "keep-alive"},
+            auto_decompress=True
+        )
 
     def __headers(self):
-        timestamp = str(int(time.time()))
-        return {
-            "Content-Type": "application/json",
-            "Connection": "keep-alive",
-            "Accept": "*/*",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Cache-Control": "no-cache",
-            "timestamp": f"{timestamp}",
-            "sign": f"{str(hashlib.sha512((str(self.appID) + str(self.appSecret) + str(timestamp)).encode('ascii')).hexdigest())}",
-            "appId": self.appID,
-            "timeStamp": timestamp
-        }
-
-    async def getESSList(self) -> Optional(list):
-        """According to SN to get system list data"""
+        timestamp = _BATCH_TS.get() or str(int(time.time()))
+        ts, cached = self._hdr_cache
+        if timestamp == ts and cached is not None:
+            return cached
+
+        sig = self._sig_base.copy()
+        sig.update(timestamp.encode('ascii'))
+        headers = self._base_headers.copy()
+        headers["timestamp"] = timestamp
+        headers["timeStamp"] = timestamp
+        headers["sign"] = sig.hexdigest()
+        self._hdr_cache = (timestamp, headers)
+        return headers
+
+    @staticmethod
+    def _query_date(queryDate, _today=None) -> str:
+        """The API only serves the current day, so any other queryDate is replaced with today's date"""
+        localdateencapsulated = _today or time.strftime("%Y-%m-%d")
+        if queryDate != localdateencapsulated:
+            logger.debug(f"Adjusting queryDate {queryDate} to {localdateencapsulated}")
+        return localdateencapsulated
+
+    async def _call(self, name, params=None, as_numpy=False) -> list | dict | None:
+        """Call the _ENDPOINTS entry for name, logging any error and returning None"""
+        path, method = _ENDPOINTS[name]
+        resource = self._urls[path]
         try:
-            resource = f"{BASEURL}/getEssList"
+            logger.debug(f"Trying to call {resource} with {params}")
 
-            logger.debug(f"Trying to call {resource}")
-
-            return await self.api_get(resource)
+            if method == "POST":
+                return await self.api_post(resource, params)
+            return await self.api_get(resource, params=params, as_numpy=as_numpy)
 
         except Exception as e:
             logger.error(f"Error: {e} when calling {resource}")
 
-    async def getLastPowerData(self, sysSn) -> Optional(list):
-        """According SN to get real-time power data"""
-        try:
-            resource = f"{BASEURL}/getLastPowerData?sysSn={sysSn}"
-
-            logger.debug(f"Trying to call {resource}")
-
-            return await self.api_get(resource)
+    async def getESSList(self, as_numpy=False) -> list | None:
+        """According to SN to get system list data"""
+        return await self._call("getESSList", as_numpy=as_numpy)
 
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+    async def getLastPowerData(self, sysSn, as_numpy=False) -> dict | None:
+        """According SN to get real-time power data"""
+        return await self._call("getLastPowerData", {"sysSn": sysSn}, as_numpy)
 
-    async def getOneDayPowerBySn(self, sysSn, queryDate) -> Optional(list):
+    async def getOneDayPowerBySn(self, sysSn, queryDate, _today=None, as_numpy=False) -> list | None:
         """According SN to get system power data"""
-        try:
-            localdateencapsulated = time.strftime("%Y-%m-%d")
-
-            if queryDate == localdateencapsulated:
-                resource = f"{BASEURL}/getOneDayPowerBySn?sysSn={sysSn}&queryDate={queryDate}"
-                logger.debug(f"Trying to call {resource}")
-            else:
-                resource = f"{BASEURL}/getOneDayPowerBySn?sysSn={sysSn}&queryDate={localdateencapsulated}"
-                logger.debug(f"Trying to call {resource} with adjusted date")
-
-            return await self.api_get(resource)
-
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
-
-    async def getSumDataForCustomer(self, sysSn) -> Optional(list):
-        """"According SN to get System Summary data"""
-        try:
-            resource = f"{BASEURL}/getSumDataForCustomer?sysSn={sysSn}"
-
-            logger.debug(f"Trying to call {resource}")
-
-            return await self.api_get(resource)
-
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+        params = {"sysSn": sysSn, "queryDate": self._query_date(queryDate, _today)}
+        return await self._call("getOneDayPowerBySn", params, as_numpy)
 
-    async def getOneDateEnergyBySn(self, sysSn, queryDate) -> Optional(list):
-        """According SN to get System Energy Data"""
-        try:
-            localdateencapsulated = time.strftime("%Y-%m-%d")
+    async def getSumDataForCustomer(self, sysSn, as_numpy=False) -> dict | None:
+        """According SN to get System Summary data
 
-            if queryDate == localdateencapsulated:
-                resource = f"{BASEURL}/getOneDateEnergyBySn?sysSn={sysSn}&queryDate={queryDate}"
-                logger.debug(f"Trying to call {resource}")
-            else:
-                resource = f"{BASEURL}/getOneDateEnergyBySn?sysSn={sysSn}&queryDate={localdateencapsulated}"
-                logger.debug(f"Trying to call {resource} with adjusted date")
+        By default the response is cached and may be up to 30s old; see cache_ttls to change or disable this.
+        """
+        return await self._call("getSumDataForCustomer", {"sysSn": sysSn}, as_numpy)
 
-            return await self.api_get(resource)
+    async def getOneDateEnergyBySn(self, sysSn, queryDate, _today=None, as_numpy=False) -> dict | None:
+        """According SN to get System Energy Data
 
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+        By default the response is cached and may be up to 15s old; see cache_ttls to change or disable this.
+        """
+        params = {"sysSn": sysSn, "queryDate": self._query_date(queryDate, _today)}
+        return await self._call("getOneDateEnergyBySn", params, as_numpy)
 
-    async def getChargeConfigInfo(self, sysSn) -> Optional(list):
-        """According SN to get charging setting information"""
-        try:
-            resource = f"{BASEURL}/getChargeConfigInfo?sysSn={sysSn}"
+    async def getChargeConfigInfo(self, sysSn, as_numpy=False) -> dict | None:
+        """According SN to get charging setting information
 
-            logger.debug(f"Trying to call {resource}")
+        By default the response is cached and may be up to 60s old; see cache_ttls to change or disable this.
+        """
+        return await self._call("getChargeConfigInfo", {"sysSn": sysSn}, as_numpy)
 
-            return await self.api_get(resource)
-
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+    async def getDisChargeConfigInfo(self, sysSn, as_numpy=False) -> dict | None:
+        """According to SN discharge setting information
 
-    async def getDisChargeConfigInfo(self, sysSn) -> Optional(list):
-        """According to SN discharge setting information"""
-        try:
-            resource = f"{BASEURL}/getDisChargeConfigInfo?sysSn={sysSn}"
-
-            logger.debug(f"Trying to call {resource}")
-
-            return await self.api_get(resource)
-
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+        By default the response is cached and may be up to 60s old; see cache_ttls to change or disable this.
+        """
+        return await self._call("getDisChargeConfigInfo", {"sysSn": sysSn}, as_numpy)
 
     async def updateChargeConfigInfo(self, sysSn, batHighCap, gridCharge, timeChae1, timeChae2, timeChaf1,
-                                     timeChaf2) -> Optional(dict):
+                                     timeChaf2) -> dict | None:
         """According SN to Set charging information"""
-        try:
-            resource = f"{BASEURL}/updateChargeConfigInfo"
-
-            settings = {
-                "sysSn": sysSn,
-                "batHighCap": batHighCap,
-                "gridCharge": gridCharge,
-                "timeChae1": timeChae1,
-                "timeChae2": timeChae2,
-                "timeChaf1": timeChaf1,
-                "timeChaf2": timeChaf2
-            }
-
-            logger.debug(f"Trying to call {resource} with settings {settings}")
-
-            return await self.api_post(resource, settings)
-
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+        return await self._call("updateChargeConfigInfo", {
+            "sysSn": sysSn,
+            "batHighCap": batHighCap,
+            "gridCharge": gridCharge,
+            "timeChae1": timeChae1,
+            "timeChae2": timeChae2,
+            "timeChaf1": timeChaf1,
+            "timeChaf2": timeChaf2
+        })
 
     async def updateDisChargeConfigInfo(self, sysSn, batUseCap, ctrDis, timeDise1, timeDise2, timeDisf1,
-                                        timeDisf2) -> Optional(dict):
+                                        timeDisf2) -> dict | None:
         """According SN to Set discharge information"""
-        try:
-            resource = f"{BASEURL}/updateDisChargeConfigInfo"
-
-            settings = {
-                "sysSn": sysSn,
-                "batUseCap": batUseCap,
-                "ctrDis": ctrDis,
-                "timeDise1": timeDise1,
-                "timeDise2": timeDise2,
-                "timeDisf1": timeDisf1,
-                "timeDisf2": timeDisf2
-            }
-
-            logger.debug(f"Trying to call {resource} with settings {settings}")
-
-            return await self.api_post(resource, settings)
-
-        except Exception as e:
-            logger.error(f"Error: {e} when calling {resource}")
+        return await self._call("updateDisChargeConfigInfo", {
+            "sysSn": sysSn,
+            "batUseCap": batUseCap,
+            "ctrDis": ctrDis,
+            "timeDise1": timeDise1,
+            "timeDise2": timeDise2,
+            "timeDisf1": timeDisf1,
+            "timeDisf2": timeDisf2
+        })
+
+    async def _send(self, method, url, **kwargs) -> dict:
+        """Send a single request over the configured transport and decode the JSON body"""
+        headers = self.__headers()
+
+        if self._httpx is not None:
+            if "data" in kwargs:
+                kwargs["content"] = kwargs.pop("data")
+            response = await self._httpx.request(method, str(url), headers=headers, **kwargs)
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
-    async def api_get(self, path, json={}) -> Optional(list):
-        """Retrieve ESS list by serial number from Alpha ESS"""
+        async with self.session.request(
+                method,
+                url,
+                headers=headers,
+                raise_for_status=True,
+                **kwargs
+        ) as response:
+            return orjson.loads(await response.read())
+
+    def _is_transient(self, error) -> bool:
+        """Whether a failed request is worth retrying"""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in RETRY_STATUSES
+        if isinstance(error, (aiohttp.ClientConnectorError, asyncio.TimeoutError)):
+            return True
+        if self._httpx is not None:
+            import httpx
+            if isinstance(error, httpx.HTTPStatusError):
+                return error.response.status_code in RETRY_STATUSES
+            return isinstance(error, httpx.TransportError)
+        return False
+
+    async def _request(self, method, url, **kwargs) -> dict:
+        """Send a request to Alpha ESS, retrying transient failures with jittered exponential backoff"""
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                async with self._sem, self._limiter:
+                    return await self._send(method, url, **kwargs)
+
+            except Exception as e:
+                if attempt == RETRY_ATTEMPTS - 1 or not self._is_transient(e):
+                    raise
+                error = e
+
+            delay = min(2 ** attempt, 30) * (0.5 + random.random() * 0.5)
+            logger.debug(f"Retrying {url} in {delay:.1f}s after error: {error!r}")
+            _BATCH_TS.set(None)
+            await asyncio.sleep(delay)
+
+    async def api_get(self, path, json={}, params=None, as_numpy=False) -> list | dict | None:
+        """Retrieve ESS list by serial number from Alpha ESS
+
+        With as_numpy=True a list of uniform records is returned as a structured numpy array.
+        """
         try:
-            headers = self.__headers()
-
-            async with self.session.get(
-                    path,
-                    headers=headers,
-                    json=json,
-                    raise_for_status=True
-            ) as response:
-
-                if response.status == 200:
-                    json_response = await response.json()
-                else:
-                    logger.error(f"Unexpected response received: {response.status} when calling {path}")
-
-                if ("msg" in json_response and json_response["msg"] != "Success") or ("msg" not in json_response):
-                    logger.error(f"Unexpected json_response : {json_response} when calling {path}")
-                    return None
-                else:
-                    if json_response["data"] is not None:
-                        return json_response["data"]
-                    else:
-                        logger.error(f"Unexpected json_response : {json_response} when calling {path}")
-                    return None
-
+            url = URL(path)
+            ttl = self._cache_ttls.get(url.name, 0)
+            if ttl > 0:
+                key = (url.path, tuple(sorted({**url.query, **(params or {})}.items())))
+                expiry, raw = self._cache.get(key, (0, None))
+                if time.monotonic() < expiry:
+                    logger.debug(f"Using cached response for {path}")
+                    data = orjson.loads(raw)
+                    return _to_numpy(data) if as_numpy else data
+
+            json_response = await self._request("GET", url, params=params, json=json)
+
+            if json_response.get("msg") != "Success" or json_response.get("data") is None:
+                logger.error(f"Unexpected json_response : {json_response} when calling {path}")
+                return None
+
+            data = json_response["data"]
+            if ttl > 0:
+                now = time.monotonic()
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                self._cache[key] = (now + ttl, orjson.dumps(data))
+            return _to_numpy(data) if as_numpy else data
 
         except Exception as e:
             logger.error(e)
             raise
 
-    async def api_post(self, path, json) -> Optional(dict):
+    async def api_post(self, path, json) -> dict | None:
         """Post data to Alpha ESS"""
         try:
-
-            headers = self.__headers()
-
-            response = await self.session.post(
-                path,
-                headers=headers,
-                json=json
-            )
-
-            response.raise_for_status()
-
-            if response.status == 200:
-                json_response = await response.json()
-            else:
-                logger.error(f"Unexpected response received: {response.status} when calling {path}")
+            json_response = await self._request("POST", path, data=orjson.dumps(json))
+            self._cache.clear()
 
             if "msg" in json_response and json_response["msg"] == "Success":
                 if json_response["data"] is None:
@@ -253,35 +397,75 @@ class alphaess:
             logger.error(e)
             raise
 
-    async def getdata(self, get_power=False, self_delay=0) -> Optional(list):
-        """Get All Data For All serial numbers from Alpha ESS"""
+    async def _fetch_unit(self, unit, today, get_power=False) -> dict:
+        """Get All Data For a single unit from Alpha ESS"""
+        serial = unit["sysSn"]
+        calls = [
+            self.getSumDataForCustomer(serial),
+            self.getOneDateEnergyBySn(serial, today, _today=today),
+            self.getLastPowerData(serial),
+            self.getChargeConfigInfo(serial),
+            self.getDisChargeConfigInfo(serial)
+        ]
+        if get_power:
+            calls.append(self.getOneDayPowerBySn(serial, today, _today=today))
+
+        results = await asyncio.gather(*calls)
+
+        unit['SumData'], unit['OneDateEnergy'], unit['LastPower'], unit['ChargeConfig'], unit[
+            'DisChargeConfig'] = results[:5]
+        if get_power:
+            unit['OneDayPower'] = results[5]
+        return unit
+
+    async def _fetch_all(self, get_power=False) -> list:
+        """Get All Data For All serial numbers, sharing one date and request timestamp across the sweep"""
+        token = _BATCH_TS.set(str(int(time.time())))
         try:
-            alldata = []
+            today = time.strftime("%Y-%m-%d")
             units = await self.getESSList()
-            for unit in units:
-                if "sysSn" in unit:
-                    serial = unit["sysSn"]
-                    unit['SumData'] = await self.getSumDataForCustomer(serial)
-                    await asyncio.sleep(self_delay)
-                    unit['OneDateEnergy'] = await self.getOneDateEnergyBySn(serial, time.strftime("%Y-%m-%d"))
-                    await asyncio.sleep(self_delay)
-                    unit['LastPower'] = await self.getLastPowerData(serial)
-                    await asyncio.sleep(self_delay)
-                    unit['ChargeConfig'] = await self.getChargeConfigInfo(serial)
-                    await asyncio.sleep(self_delay)
-                    unit['DisChargeConfig'] = await self.getDisChargeConfigInfo(serial)
-                    if get_power:
-                        await asyncio.sleep(self_delay)
-                        unit['OneDayPower'] = await self.getOneDayPowerBySn(serial, time.strftime("%Y-%m-%d"))
-                    alldata.append(unit)
-                    logger.debug(alldata)
+            return list(await asyncio.gather(
+                *[self._fetch_unit(unit, today, get_power) for unit in units if "sysSn" in unit]
+            ))
+        finally:
+            _BATCH_TS.reset(token)
+
+    async def getdata(self, get_power=False, self_delay=0) -> list:
+        """Get All Data For All serial numbers from Alpha ESS
+
+        self_delay is accepted for backwards compatibility only; request pacing is handled by the rate_per_sec limiter.
+        """
+        try:
+            alldata = await self._fetch_all(get_power)
+            logger.debug(alldata)
             return alldata
 
         except Exception as e:
             logger.error(e)
             raise
 
-    async def authenticate(self) -> Optional(list):
+    async def getdata_soa(self, get_power=False) -> ESSBatch:
+        """Get All Data For All serial numbers from Alpha ESS as an ESSBatch of parallel lists"""
+        try:
+            alldata = await self._fetch_all(get_power)
+
+            batch = ESSBatch()
+            for unit in alldata:
+                batch.sys_sns.append(unit["sysSn"])
+                batch.sum_data.append(unit["SumData"])
+                batch.one_date_energy.append(unit["OneDateEnergy"])
+                batch.last_power.append(unit["LastPower"])
+                batch.charge_cfg.append(unit["ChargeConfig"])
+                batch.discharge_cfg.append(unit["DisChargeConfig"])
+                batch.one_day_power.append(unit.get("OneDayPower"))
+            logger.debug(batch)
+            return batch
+
+        except Exception as e:
+            logger.error(e)
+            raise
+
+    async def authenticate(self) -> bool:
         """Test Authentication to AlphaESS Open API By Calling getESSList()"""
 
         try:
@@ -299,18 +483,18 @@ class alphaess:
     async def setbatterycharge(self, serial, enabled, cp1start, cp1end, cp2start, cp2end, chargestopsoc):
         """Set battery grid charging"""
         try:
-            settings = []
-
-            settings["sysSn"] = serial
-            settings["gridCharge"] = int(enabled)
-            settings["timeChaf1"] = cp1start
-            settings["timeChae1"] = cp1end
-            settings["timeChaf2"] = cp2start
-            settings["timeChae2"] = cp2end
-            settings["batHighCap"] = int(chargestopsoc)
+            settings = {
+                "sysSn": serial,
+                "gridCharge": int(enabled),
+                "timeChaf1": cp1start,
+                "timeChae1": cp1end,
+                "timeChaf2": cp2start,
+                "timeChae2": cp2end,
+                "batHighCap": int(chargestopsoc)
+            }
 
             logger.debug(f"Trying to set charge settings for system {serial}")
-            await self.api_post(path="updateChargeConfigInfo", json=settings)
+            await self.api_post(path=self._urls["updateChargeConfigInfo"], json=settings)
 
         except Exception as e:
             logger.error(e)
@@ -319,18 +503,18 @@ class alphaess:
     async def setbatterydischarge(self, serial, enabled, dp1start, dp1end, dp2start, dp2end, dischargecutoffsoc):
         """Set battery discharging"""
         try:
-            settings = []
-
-            settings["sysSn"] = serial
-            settings["ctrDis"] = int(enabled)
-            settings["timeDisf1"] = dp1start
-            settings["timeDise1"] = dp1end
-            settings["timeDisf2"] = dp2start
-            settings["timeDise2"] = dp2end
-            settings["batUseCap"] = int(dischargecutoffsoc)
+            settings = {
+                "sysSn": serial,
+                "ctrDis": int(enabled),
+                "timeDisf1": dp1start,
+                "timeDise1": dp1end,
+                "timeDisf2": dp2start,
+                "timeDise2": dp2end,
+                "batUseCap": int(dischargecutoffsoc)
+            }
 
             logger.debug(f"Trying to set discharge settings for system {serial}")
-            await self.api_post(path="updateDisChargeConfigInfo", json=settings)
+            await self.api_post(path=self._urls["updateDisChargeConfigInfo"], json=settings)
 
         except Exception as e:
             logger.error(e)